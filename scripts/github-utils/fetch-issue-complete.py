@@ -2,18 +2,49 @@
 """Fetch GitHub issue data with attachments"""
 
 import argparse
+import hashlib
+import html
+import http.client
+import io
 import json
 import logging
 import os
+import random
 import re
+import shutil
+import ssl
 import sys
+import threading
 import time
+import urllib.parse
 import urllib.request
 import urllib.error
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Callable
-from html.parser import HTMLParser
+
+# orjson parses large API responses 2-3x faster and accepts bytes directly, and
+# encodes issue.json several times faster; fall back to the standard library so
+# the script still runs standalone
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, compact unless pretty is set"""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, compact unless pretty is set"""
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 
 # Configure logging
@@ -29,6 +60,113 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 5
 INITIAL_RETRY_DELAY = 1  # seconds
 RETRY_BACKOFF_MULTIPLIER = 2
+MAX_RETRY_DELAY = 60  # seconds
+
+# Client-side rate limiting (GitHub allows 5000 requests/hour per token)
+RATE_LIMIT_CAPACITY = 100  # burst size
+RATE_LIMIT_PER_SECOND = 5000 / 3600
+RATE_LIMIT_LOW_WATERMARK = 50  # pause until reset below this many remaining
+
+# HTTP configuration
+MAX_REDIRECTS = 10
+
+# Download configuration
+MAX_DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes per read when streaming to disk
+
+
+# GitHub GraphQL API
+GRAPHQL_URL = "https://api.github.com/graphql"
+COMMENTS_PAGE_SIZE = 100  # GitHub's max page size for connections
+
+COMMENT_FIELDS = """
+fragment CommentFields on IssueCommentConnection {
+  nodes {
+    fullDatabaseId
+    author { login }
+    createdAt
+    body
+    bodyHTML
+  }
+  pageInfo { endCursor hasNextPage }
+}
+"""
+
+ISSUE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $pageSize: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      id
+      fullDatabaseId
+      number
+      title
+      state
+      stateReason
+      locked
+      url
+      body
+      bodyHTML
+      createdAt
+      updatedAt
+      closedAt
+      authorAssociation
+      author { login }
+      assignees(first: 100) { nodes { login } }
+      milestone { number title description state dueOn url }
+      labels(first: 100) { nodes { id name color description isDefault } }
+      reactionGroups { content reactors { totalCount } }
+      comments(first: $pageSize) { totalCount ...CommentFields }
+    }
+  }
+}
+""" + COMMENT_FIELDS
+
+# GraphQL reaction content -> REST reactions key
+REACTION_KEYS = {
+    'THUMBS_UP': '+1',
+    'THUMBS_DOWN': '-1',
+    'LAUGH': 'laugh',
+    'HOORAY': 'hooray',
+    'CONFUSED': 'confused',
+    'HEART': 'heart',
+    'ROCKET': 'rocket',
+    'EYES': 'eyes',
+}
+
+COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $pageSize: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      comments(first: $pageSize, after: $after) { ...CommentFields }
+    }
+  }
+}
+""" + COMMENT_FIELDS
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP-date"""
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(retry_delay: float) -> float:
+    """Apply jitter to a backoff delay so concurrent clients don't retry in lockstep"""
+    return min(retry_delay * random.uniform(0.5, 1.5), MAX_RETRY_DELAY)
 
 
 def retry_on_transient_errors(func: Callable) -> Callable:
@@ -36,12 +174,15 @@ def retry_on_transient_errors(func: Callable) -> Callable:
     Decorator to retry function on transient HTTP errors with exponential backoff.
 
     Retries on:
+    - HTTP 429 Too Many Requests (and 403 with Retry-After, GitHub's secondary rate limit)
     - HTTP 502 Bad Gateway
     - HTTP 503 Service Unavailable
     - HTTP 504 Gateway Timeout
     - Network/connection errors (URLError)
+    - Connections dropped mid-response (ConnectionError, TimeoutError, IncompleteRead)
 
-    Uses exponential backoff: 1s, 2s, 4s, 8s, 16s
+    Honors the Retry-After header when present, otherwise uses jittered
+    exponential backoff around 1s, 2s, 4s, 8s, 16s (capped at 60s).
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -53,15 +194,21 @@ def retry_on_transient_errors(func: Callable) -> Callable:
                 return func(*args, **kwargs)
 
             except urllib.error.HTTPError as e:
-                # Only retry on transient server errors
-                if e.code in (502, 503, 504):
+                retry_after = _retry_after_seconds(e.headers)
+
+                # Only retry on transient server errors and rate limiting
+                if e.code in (429, 502, 503, 504) or (e.code == 403 and retry_after is not None):
                     last_exception = e
                     if attempt < MAX_RETRIES:
+                        if retry_after is not None:
+                            sleep_time = min(retry_after, MAX_RETRY_DELAY)
+                        else:
+                            sleep_time = _backoff_delay(retry_delay)
                         logger.warning(
                             f"Transient error ({e.code} {e.reason}) on attempt {attempt}/{MAX_RETRIES}. "
-                            f"Retrying in {retry_delay}s..."
+                            f"Retrying in {sleep_time:.1f}s..."
                         )
-                        time.sleep(retry_delay)
+                        time.sleep(sleep_time)
                         retry_delay *= RETRY_BACKOFF_MULTIPLIER
                         continue
                     else:
@@ -77,11 +224,12 @@ def retry_on_transient_errors(func: Callable) -> Callable:
                 # Retry on network/connection errors (timeouts, connection refused, etc.)
                 last_exception = e
                 if attempt < MAX_RETRIES:
+                    sleep_time = _backoff_delay(retry_delay)
                     logger.warning(
                         f"Network error ({e.reason}) on attempt {attempt}/{MAX_RETRIES}. "
-                        f"Retrying in {retry_delay}s..."
+                        f"Retrying in {sleep_time:.1f}s..."
                     )
-                    time.sleep(retry_delay)
+                    time.sleep(sleep_time)
                     retry_delay *= RETRY_BACKOFF_MULTIPLIER
                     continue
                 else:
@@ -90,6 +238,24 @@ def retry_on_transient_errors(func: Callable) -> Callable:
                         f"Giving up."
                     )
 
+            except (ConnectionError, TimeoutError, http.client.IncompleteRead, http.client.RemoteDisconnected) as e:
+                # Retry on connections dropped mid-response (reset, timed out, truncated body)
+                last_exception = e
+                if attempt < MAX_RETRIES:
+                    sleep_time = _backoff_delay(retry_delay)
+                    logger.warning(
+                        f"Connection error ({type(e).__name__}: {e}) on attempt {attempt}/{MAX_RETRIES}. "
+                        f"Retrying in {sleep_time:.1f}s..."
+                    )
+                    time.sleep(sleep_time)
+                    retry_delay *= RETRY_BACKOFF_MULTIPLIER
+                    continue
+                else:
+                    logger.error(
+                        f"Max retries ({MAX_RETRIES}) reached for connection error. "
+                        f"Giving up."
+                    )
+
             except Exception:
                 # For other exceptions, don't retry
                 raise
@@ -100,103 +266,233 @@ def retry_on_transient_errors(func: Callable) -> Callable:
     return wrapper
 
 
-class AttachmentExtractor(HTMLParser):
-    """Extract attachment URLs from HTML content"""
+class TokenBucket:
+    """Thread-safe token bucket that paces requests made with one GitHub token"""
+
+    def __init__(self, capacity: int, refill_rate_per_sec: float):
+        self.capacity = capacity
+        self.refill_rate_per_sec = refill_rate_per_sec
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last refill"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate_per_sec)
+        self.last_refill = now
+
+    def acquire(self, cost: int = 1) -> None:
+        """Block until `cost` tokens are available, then consume them"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                time.sleep(self.paused_until - now)
+                now = time.monotonic()
+                self.last_refill = now
+
+            self._refill(now)
+            if self.tokens < cost:
+                time.sleep((cost - self.tokens) / self.refill_rate_per_sec)
+                self._refill(time.monotonic())
+
+            self.tokens -= cost
+
+    def update_from_headers(self, headers) -> None:
+        """Pause until the rate limit resets when GitHub reports few requests remaining"""
+        try:
+            remaining = int(headers.get('X-RateLimit-Remaining'))
+            reset = int(headers.get('X-RateLimit-Reset'))
+        except (TypeError, ValueError):
+            return
+
+        if remaining < RATE_LIMIT_LOW_WATERMARK:
+            wait = max(0.0, reset - time.time())
+            logger.warning(f"Only {remaining} API requests remaining, pausing {wait:.0f}s until rate limit reset")
+            with self._lock:
+                self.tokens = 0
+                self.paused_until = time.monotonic() + wait
+
+
+_RATE_LIMITERS: Dict[str, TokenBucket] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(github_token: str) -> TokenBucket:
+    """Return the shared token bucket for a GitHub token"""
+    with _RATE_LIMITERS_LOCK:
+        bucket = _RATE_LIMITERS.get(github_token)
+        if bucket is None:
+            bucket = TokenBucket(RATE_LIMIT_CAPACITY, RATE_LIMIT_PER_SECOND)
+            _RATE_LIMITERS[github_token] = bucket
+        return bucket
+
+
+class KeepAliveResponse:
+    """HTTP response that keeps its pooled connection reusable once fully read"""
+
+    def __init__(self, response: http.client.HTTPResponse, connection: http.client.HTTPSConnection, url: str):
+        self._response = response
+        self._connection = connection
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Read up to amt bytes (or the whole body) from the response"""
+        return self._response.read(amt)
+
+    def close(self) -> None:
+        """Release the response; drop the connection if the body was not consumed"""
+        if not self._response.isclosed() or self._response.will_close:
+            self._connection.close()
+        self._response.close()
+
+    def __enter__(self) -> 'KeepAliveResponse':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """Per-thread persistent HTTPS connections keyed by host, reused across requests"""
+
+    def __init__(self, context: Optional[ssl.SSLContext] = None):
+        self._context = context or ssl.create_default_context()
+        self._local = threading.local()
+
+    def _get_connection(self, host: str, port: int, timeout: float) -> http.client.HTTPSConnection:
+        """Return this thread's connection to host:port, creating it if needed"""
+        connections = self._local.__dict__.setdefault('connections', {})
+        connection = connections.get((host, port))
+        if connection is None:
+            connection = http.client.HTTPSConnection(host, port, timeout=timeout, context=self._context)
+            connections[(host, port)] = connection
+        connection.timeout = timeout
+        return connection
+
+    def _send(self, connection: http.client.HTTPSConnection, method: str, path: str,
+              headers: Dict[str, str], body: Optional[bytes]) -> http.client.HTTPResponse:
+        """Send a request, retrying once if an idle keep-alive connection was closed by the server"""
+        for attempt in (1, 2):
+            reused = connection.sock is not None
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                return connection.getresponse()
+            except (ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused and attempt == 1:
+                    continue
+                raise
+            except http.client.HTTPException:
+                connection.close()
+                raise
+            except OSError as e:
+                # Mirror urlopen: connection failures surface as URLError
+                connection.close()
+                raise urllib.error.URLError(e) from e
 
-    def __init__(self):
-        super().__init__()
-        self.attachments: List[Dict[str, Any]] = []
-        self._current_img_attrs: Optional[Dict[str, str]] = None
-
-    def handle_starttag(self, tag, attrs):
-        """Process HTML start tags to extract attachments"""
-        attrs_dict = dict(attrs)
-
-        if tag == 'img':
-            # Extract image URLs from <img src="...">
-            src = attrs_dict.get('src', '')
-            if self._is_attachment_url(src):
-                attachment = {
-                    'url': src,
-                    'filename': self._extract_filename(src),
-                    'file_type': self._extract_file_type(src),
-                    'dimensions': self._extract_dimensions(attrs_dict),
-                    'tag_type': 'img'
-                }
-                self.attachments.append(attachment)
-
-        elif tag == 'a':
-            # Extract file URLs from <a href="...">
-            href = attrs_dict.get('href', '')
-            if self._is_attachment_url(href):
-                attachment = {
-                    'url': href,
-                    'filename': self._extract_filename(href),
-                    'file_type': self._extract_file_type(href),
-                    'dimensions': None,  # Links don't have dimensions
-                    'tag_type': 'a'
-                }
-                self.attachments.append(attachment)
+    def request(self, method: str, url: str, headers: Dict[str, str],
+                body: Optional[bytes] = None, timeout: float = 30) -> KeepAliveResponse:
+        """Perform a request, following redirects and raising HTTPError on non-2xx like urlopen"""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme != 'https':
+                request = urllib.request.Request(url, data=body, headers=headers, method=method)
+                return urllib.request.urlopen(request, timeout=timeout)
 
-    def _is_attachment_url(self, url: str) -> bool:
-        """Check if URL is a GitHub attachment URL"""
-        if not url:
-            return False
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
 
-        # Check for GitHub attachment domains
-        attachment_domains = [
-            'user-attachments.githubusercontent.com',
-            'private-user-images.githubusercontent.com',
-            'github-production-user-asset',  # Newer GitHub asset URLs
-        ]
+            connection = self._get_connection(parts.hostname, parts.port or 443, timeout)
+            response = KeepAliveResponse(self._send(connection, method, path, headers, body), connection, url)
 
-        return any(domain in url for domain in attachment_domains)
-
-    def _extract_filename(self, url: str) -> str:
-        """Extract filename from URL path"""
-        # Match UUID-style filename with extension before JWT parameters
-        match = re.search(r'/([a-f0-9-]+\.[\w]+)(?:\?|$)', url)
-        if match:
-            return match.group(1)
-
-        # Fallback: extract anything after last slash before query params
-        match = re.search(r'/([^/?]+)(?:\?|$)', url)
-        if match:
-            return match.group(1)
-
-        return 'unknown_file'
-
-    def _extract_file_type(self, url: str) -> str:
-        """Detect file type from URL extension"""
-        # Extract extension from filename
-        filename = self._extract_filename(url)
-        match = re.search(r'\.(\w+)$', filename)
-        if match:
-            ext = match.group(1).lower()
-            return ext
-
-        return 'unknown'
-
-    def _extract_dimensions(self, attrs: Dict[str, str]) -> Optional[Dict[str, int]]:
-        """Extract image dimensions from img tag attributes"""
-        width = attrs.get('width')
-        height = attrs.get('height')
-
-        if width or height:
-            dimensions = {}
-            if width:
-                try:
-                    dimensions['width'] = int(width)
-                except ValueError:
-                    pass
-            if height:
-                try:
-                    dimensions['height'] = int(height)
-                except ValueError:
-                    pass
-            return dimensions if dimensions else None
+            location = response.headers.get('Location')
+            if response.status in (301, 302, 303, 307, 308) and location:
+                # Drain the redirect body so the connection can be reused
+                response.read()
+                response.close()
+
+                if response.status == 303 or (response.status in (301, 302) and method == 'POST'):
+                    method, body = 'GET', None
+                    headers = {k: v for k, v in headers.items() if k.lower() not in ('content-type', 'content-length')}
+
+                new_url = urllib.parse.urljoin(url, location)
+                if urllib.parse.urlsplit(new_url).hostname != parts.hostname:
+                    # Never forward credentials to another host (e.g. S3 attachment storage)
+                    headers = {k: v for k, v in headers.items() if k.lower() != 'authorization'}
+                url = new_url
+                continue
+
+            if not 200 <= response.status < 300:
+                error_body = response.read()
+                response.close()
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers,
+                                             io.BytesIO(error_body))
+
+            return response
+
+        raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+
+_CONNECTION_POOL = ConnectionPool()
+
+
+def open_url(request, timeout: float = 30):
+    """
+    Drop-in replacement for urllib.request.urlopen that reuses HTTPS connections.
+
+    urlopen sends "Connection: close" and pays a TCP+TLS handshake per request;
+    this keeps one connection per host per thread alive instead. Falls back to
+    urlopen for non-HTTPS URLs or when an HTTPS proxy is configured.
+    """
+    if isinstance(request, str):
+        request = urllib.request.Request(request)
+
+    if request.type != 'https' or urllib.request.getproxies().get('https'):
+        return urllib.request.urlopen(request, timeout=timeout)
+
+    headers = dict(request.header_items())
+    headers.setdefault('User-Agent', 'github-issue-fetcher')
+    return _CONNECTION_POOL.request(request.get_method(), request.full_url, headers, request.data, timeout)
 
-        return None
+
+# Attachment extraction patterns (compiled once at import)
+# Matches <img ... src="..."> and <a ... href="..."> in a single scan
+ATTACHMENT_TAG_RE = re.compile(
+    r'<(?:(img)\b[^>]*?\ssrc|(a)\b[^>]*?\shref)\s*=\s*"([^"]*)"[^>]*>',
+    re.IGNORECASE
+)
+ATTACHMENT_URL_PREFIXES = (
+    'https://user-attachments.githubusercontent.com/',
+    'https://private-user-images.githubusercontent.com/',
+    'https://github-production-user-asset',  # Newer GitHub asset URLs
+)
+FILENAME_RE = re.compile(r'/([a-f0-9-]+\.[\w]+)(?:\?|$)')  # UUID-style name before JWT params
+FILENAME_FALLBACK_RE = re.compile(r'/([^/?]+)(?:\?|$)')  # Anything after last slash
+EXTENSION_RE = re.compile(r'\.(\w+)$')
+DIMENSION_RE = re.compile(r'\s(width|height)\s*=\s*"(\d+)"', re.IGNORECASE)
+
+
+def _extract_filename(url: str) -> str:
+    """Extract filename from URL path"""
+    match = FILENAME_RE.search(url) or FILENAME_FALLBACK_RE.search(url)
+    if match:
+        return match.group(1)
+
+    return 'unknown_file'
+
+
+def _extract_file_type(filename: str) -> str:
+    """Detect file type from filename extension"""
+    match = EXTENSION_RE.search(filename)
+    if match:
+        return match.group(1).lower()
+
+    return 'unknown'
 
 
 def extract_attachments_from_html(html_content: str) -> List[Dict[str, Any]]:
@@ -204,25 +500,132 @@ def extract_attachments_from_html(html_content: str) -> List[Dict[str, Any]]:
     if not html_content:
         return []
 
-    parser = AttachmentExtractor()
+    attachments = []
+    for match in ATTACHMENT_TAG_RE.finditer(html_content):
+        # Attachment URL prefixes contain no HTML entities, so filter before unescaping;
+        # most links (issues, avatars, emoji) are rejected by this single startswith
+        raw_url = match.group(3)
+        if not raw_url.startswith(ATTACHMENT_URL_PREFIXES):
+            continue
+
+        is_img = match.group(1) is not None
+        url = html.unescape(raw_url) if '&' in raw_url else raw_url
+
+        # Links don't have dimensions
+        dimensions = None
+        if is_img:
+            dimensions = {name.lower(): int(value) for name, value in DIMENSION_RE.findall(match.group(0))} or None
+
+        filename = _extract_filename(url)
+        attachments.append({
+            'url': url,
+            'filename': filename,
+            'file_type': _extract_file_type(filename),
+            'dimensions': dimensions,
+            'tag_type': 'img' if is_img else 'a'
+        })
+
+    return attachments
+
+
+# Human-readable download errors by exception class; the most specific class in
+# the exception's MRO wins, matching the order of separate except clauses
+DOWNLOAD_ERROR_MESSAGES: Dict[type, Callable[[BaseException], str]] = {
+    urllib.error.HTTPError: lambda e: f"HTTP {e.code}: {e.reason}",
+    urllib.error.URLError: lambda e: f"Network error: {e.reason}",
+    TimeoutError: lambda e: "Download timed out (30 seconds)",
+    OSError: lambda e: f"Filesystem error: {e}",
+    Exception: lambda e: f"Unexpected error: {e}",
+}
+
+
+def describe_download_error(error: BaseException) -> str:
+    """Describe a download failure for logs and metadata"""
+    for cls in type(error).__mro__:
+        formatter = DOWNLOAD_ERROR_MESSAGES.get(cls)
+        if formatter:
+            return formatter(error)
+    return f"Unexpected error: {error}"
+
+
+# Manifest attachment table rows, bound once as format callables
+ISSUE_ATTACHMENT_ROW = "| {} | {} | {} | {} | @{} | `{}` |\n".format
+COMMENT_ATTACHMENT_ROW = "| {} | {} | {} | {} | `{}` |\n".format
+
+# Formatting helpers (cached: manifests repeat the same timestamps, sizes and dimensions)
+@lru_cache(maxsize=4096)
+def _format_datetime(iso_timestamp: str) -> str:
+    """Format ISO 8601 timestamp to human-readable format"""
     try:
-        parser.feed(html_content)
-    except Exception as e:
-        logger.warning(f"Failed to parse HTML content: {e}")
-        return []
+        # Parse ISO timestamp
+        dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
+
+        # Format as readable string
+        return dt.strftime("%B %d, %Y at %I:%M %p UTC")
+    except Exception:
+        # Fallback: return original string if parsing fails
+        return iso_timestamp
 
-    return parser.attachments
+
+@lru_cache(maxsize=1024)
+def _format_file_size(size_bytes: int) -> str:
+    """Format file size in human-readable format"""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    elif size_bytes < 1024 * 1024 * 1024:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+    else:
+        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+
+
+@lru_cache(maxsize=256)
+def _format_dimensions(width: Any, height: Any) -> str:
+    """Format an image's (width, height) for display"""
+    return f"{width}x{height}"
+
+
+def _dimension_map(attachments: List[Dict[str, Any]]) -> Dict[str, Optional[Dict[str, int]]]:
+    """
+    Map attachment filenames to their dimensions.
+
+    A file can appear both as an <img> (with dimensions) and as an <a> link
+    (without); the entry that has dimensions wins.
+    """
+    dim_map = {}
+    for att in attachments:
+        if not dim_map.get(att['filename']):
+            dim_map[att['filename']] = att.get('dimensions')
+    return dim_map
+
+
+def _full_database_id(node: Dict[str, Any], description: str) -> int:
+    """
+    Return a GraphQL node's REST id.
+
+    databaseId is a 32-bit Int and cannot hold current issue/comment ids, so the
+    BigInt fullDatabaseId (serialized as a string) is used instead.
+    """
+    value = node.get('fullDatabaseId')
+    if value is None:
+        raise RuntimeError(f"GraphQL response is missing fullDatabaseId for {description}")
+    return int(value)
 
 
 class IssueDataFetcher:
     """Fetches GitHub issue data including attachments"""
 
-    def __init__(self, repo: str, issue_number: int, output_dir: str, github_token: str):
+    def __init__(self, repo: str, issue_number: int, output_dir: str, github_token: str, force: bool = False,
+                 pretty: bool = False):
         """Initialize the issue data fetcher"""
         self.repo = repo
         self.issue_number = issue_number
+        self.force = force
+        self.pretty = pretty
         self.output_dir = Path(output_dir)
         self.github_token = github_token.strip()  # Strip whitespace from token
+        self.rate_limiter = get_rate_limiter(self.github_token)
 
         # Parse repository owner and name
         parts = repo.split('/')
@@ -236,6 +639,15 @@ class IssueDataFetcher:
         self.issue_attachments_dir = self.attachments_dir / "issue"
         self.comments_attachments_dir = self.attachments_dir / "comments"
 
+        # Working directory captured once for building absolute file locations
+        self._cwd = os.getcwd()
+
+        # File sizes recorded by the previous run ({file_location: size})
+        self._previous_download_sizes: Dict[str, int] = {}
+
+        # Hash of the last saved issue content, used to skip unchanged issues
+        self.content_hash_file = self.output_dir / ".content_hash"
+
     def validate_inputs(self) -> None:
         """Validate input arguments"""
         logger.info("Validating inputs...")
@@ -282,24 +694,131 @@ class IssueDataFetcher:
             raise
 
     @retry_on_transient_errors
-    def fetch_issue_html(self, repo: str, issue_number: int, github_token: str) -> Dict[str, Any]:
-        """Fetch issue data from GitHub API with body_html format"""
-        url = f"https://api.github.com/repos/{repo}/issues/{issue_number}"
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a GraphQL query against the GitHub API (with retry logic)"""
+        self.rate_limiter.acquire()
 
-        try:
-            # Create request with authentication and full+json accept header
-            req = urllib.request.Request(url)
-            req.add_header("Accept", "application/vnd.github.full+json")
-            req.add_header("Authorization", f"token {github_token}")
-            req.add_header("User-Agent", "github-issue-fetcher")
+        payload = json.dumps({"query": query, "variables": variables}).encode('utf-8')
+
+        request = urllib.request.Request(GRAPHQL_URL, data=payload, method='POST')
+        request.add_header('Authorization', f'token {self.github_token}')
+        request.add_header('Content-Type', 'application/json')
+        request.add_header('User-Agent', 'github-issue-fetcher')
+
+        with open_url(request, timeout=30) as response:
+            self.rate_limiter.update_from_headers(response.headers)
+            result = json_loads(response.read())
 
-            logger.info(f"Fetching issue from: {url}")
+        # GraphQL reports most failures with HTTP 200 and an "errors" list
+        errors = result.get('errors')
+        if errors:
+            if any(error.get('type') == 'NOT_FOUND' for error in errors):
+                raise RuntimeError(
+                    f"Not found (404): Issue #{self.issue_number} does not exist in {self.repo}, "
+                    f"or you don't have access to this repository."
+                )
+            messages = '; '.join(error.get('message', 'Unknown error') for error in errors)
+            raise RuntimeError(f"GraphQL error: {messages}")
+
+        return result['data']
+
+    def _convert_comment(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a GraphQL comment node to the comment_info structure"""
+        body_html = node.get('bodyHTML') or ''
+        author = node.get('author')
+
+        return {
+            'comment_id': _full_database_id(node, 'comment'),
+            'author': author['login'] if author else 'ghost',
+            'created_at': node['createdAt'],
+            'body': node.get('body') or '',
+            'body_html': body_html,
+            '_attachments': extract_attachments_from_html(body_html)
+        }
+
+    def fetch_issue_graphql(self) -> Dict[str, Any]:
+        """Fetch issue and all comments via GraphQL (one request per 100 comments)"""
+        variables = {
+            "owner": self.owner,
+            "name": self.repo_name,
+            "number": self.issue_number,
+            "pageSize": COMMENTS_PAGE_SIZE
+        }
+
+        try:
+            logger.info(f"Fetching issue and comments from: {GRAPHQL_URL}")
+            issue = self._graphql(ISSUE_QUERY, variables)['repository']['issue']
+            if issue is None:
+                raise RuntimeError(
+                    f"Not found (404): Issue #{self.issue_number} does not exist in {self.repo}, "
+                    f"or you don't have access to this repository."
+                )
+
+            # Map GraphQL fields to the REST issue shape used by the rest of the script
+            author = issue.get('author')
+            assignees = [{'login': node['login']} for node in issue['assignees']['nodes']]
+            milestone = issue.get('milestone')
+            state_reason = issue.get('stateReason')
+
+            reactions = {key: 0 for key in REACTION_KEYS.values()}
+            for group in issue.get('reactionGroups') or []:
+                key = REACTION_KEYS.get(group['content'])
+                if key:
+                    reactions[key] = group['reactors']['totalCount']
+            reactions = {'total_count': sum(reactions.values()), **reactions}
+
+            issue_data = {
+                'id': _full_database_id(issue, f"issue #{self.issue_number}"),
+                'node_id': issue['id'],
+                'number': issue['number'],
+                'title': issue['title'],
+                'state': issue['state'].lower(),
+                'state_reason': state_reason.lower() if state_reason else None,
+                'locked': issue['locked'],
+                'html_url': issue['url'],
+                'user': {'login': author['login'] if author else 'ghost'},
+                'author_association': issue['authorAssociation'],
+                'labels': [
+                    {
+                        'node_id': label['id'],
+                        'name': label['name'],
+                        'color': label['color'],
+                        'description': label.get('description'),
+                        'default': label['isDefault']
+                    }
+                    for label in issue['labels']['nodes']
+                ],
+                'assignee': assignees[0] if assignees else None,
+                'assignees': assignees,
+                'milestone': {
+                    'number': milestone['number'],
+                    'title': milestone['title'],
+                    'description': milestone.get('description'),
+                    'state': milestone['state'].lower(),
+                    'due_on': milestone.get('dueOn'),
+                    'html_url': milestone['url']
+                } if milestone else None,
+                'comments': issue['comments']['totalCount'],
+                'reactions': reactions,
+                'created_at': issue['createdAt'],
+                'updated_at': issue['updatedAt'],
+                'closed_at': issue.get('closedAt'),
+                'body': issue.get('body') or '',
+                'body_html': issue.get('bodyHTML') or ''
+            }
 
-            # Make API call
-            with urllib.request.urlopen(req, timeout=30) as response:
-                issue_data = json.loads(response.read().decode('utf-8'))
-                logger.info(f"✓ Successfully fetched issue #{issue_number}")
-                return issue_data
+            # Only issue follow-up requests when there are more than 100 comments
+            connection = issue['comments']
+            comments = [self._convert_comment(node) for node in connection['nodes']]
+            while connection['pageInfo']['hasNextPage']:
+                variables['after'] = connection['pageInfo']['endCursor']
+                logger.info(f"Fetching more comments (after {len(comments)})...")
+                connection = self._graphql(COMMENTS_QUERY, variables)['repository']['issue']['comments']
+                comments.extend(self._convert_comment(node) for node in connection['nodes'])
+
+            issue_data['_comments'] = comments
+            logger.info(f"✓ Successfully fetched issue #{self.issue_number} with {len(comments)} comment(s)")
+            return issue_data
 
         except urllib.error.HTTPError as e:
             error_body = e.read().decode('utf-8') if e.fp else "No error details"
@@ -314,11 +833,6 @@ class IssueDataFetcher:
                     f"Forbidden (403): Access denied. Your token may lack required permissions "
                     f"or you may have hit rate limits. Details: {error_body}"
                 ) from e
-            elif e.code == 404:
-                raise RuntimeError(
-                    f"Not found (404): Issue #{issue_number} does not exist in {repo}, "
-                    f"or you don't have access to this repository."
-                ) from e
             else:
                 raise RuntimeError(
                     f"HTTP error {e.code}: {e.reason}. Details: {error_body}"
@@ -335,104 +849,13 @@ class IssueDataFetcher:
                 f"Invalid JSON response from GitHub API: {e}"
             ) from e
 
-        except Exception as e:
-            raise RuntimeError(
-                f"Unexpected error fetching issue data: {e}"
-            ) from e
-
-    @retry_on_transient_errors
-    def _fetch_comments_page(self, api_url: str, github_token: str) -> tuple:
-        """Fetch a single page of comments from GitHub API (with retry logic)"""
-        # Create request with authentication and full+json accept header
-        request = urllib.request.Request(api_url)
-        request.add_header('Authorization', f'token {github_token}')
-        request.add_header('Accept', 'application/vnd.github.full+json')
-        request.add_header('User-Agent', 'github-issue-fetcher')
-
-        # Make API request
-        with urllib.request.urlopen(request, timeout=30) as response:
-            # Parse JSON response
-            comments_data = json.loads(response.read().decode('utf-8'))
-
-            # Check for Link header for pagination
-            link_header = response.headers.get('Link', '')
-            has_next_page = 'rel="next"' in link_header
-
-            return comments_data, has_next_page
-
-    def fetch_comments_html(self, repo: str, issue_number: int, github_token: str) -> List[Dict[str, Any]]:
-        """Fetch all comments for an issue with HTML body included"""
-        logger.info(f"Fetching comments for issue #{issue_number}...")
-
-        all_comments = []
-        page = 1
-        per_page = 100  # GitHub's max per_page value
-
-        while True:
-            # Build API URL with pagination
-            api_url = f"https://api.github.com/repos/{repo}/issues/{issue_number}/comments"
-            api_url += f"?per_page={per_page}&page={page}"
-
-            logger.info(f"Fetching comments page {page}...")
-
-            try:
-                # Fetch page (with automatic retry on transient errors)
-                comments_data, has_next_page = self._fetch_comments_page(api_url, github_token)
-
-                # If empty, we've reached the end
-                if not comments_data:
-                    logger.info(f"No more comments (page {page} was empty)")
-                    break
-
-                # Extract comment data
-                for comment in comments_data:
-                    body_html = comment.get('body_html', '')
-
-                    # Extract attachments from comment body_html
-                    attachments = extract_attachments_from_html(body_html)
-
-                    comment_info = {
-                        'comment_id': comment['id'],
-                        'author': comment['user']['login'] if comment.get('user') else 'ghost',
-                        'created_at': comment['created_at'],
-                        'body': comment.get('body', ''),
-                        'body_html': body_html,
-                        '_attachments': attachments
-                    }
-                    all_comments.append(comment_info)
-
-                logger.info(f"✓ Fetched {len(comments_data)} comments from page {page}")
-
-                # Check if there are more pages
-                if not has_next_page:
-                    logger.info(f"✓ All comments fetched (no more pages)")
-                    break
-
-                # Move to next page
-                page += 1
-
-            except urllib.error.HTTPError as e:
-                error_body = e.read().decode('utf-8') if e.fp else 'No error body'
-                logger.error(f"GitHub API error: {e.code} {e.reason}")
-                logger.error(f"Error body: {error_body}")
-                raise RuntimeError(f"Failed to fetch comments: HTTP {e.code} - {e.reason}") from e
-            except urllib.error.URLError as e:
-                logger.error(f"Network error: {e.reason}")
-                raise RuntimeError(f"Failed to fetch comments: {e.reason}") from e
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse API response: {e}")
-                raise RuntimeError(f"Invalid JSON response from GitHub API") from e
-
-        logger.info(f"✓ Total comments fetched: {len(all_comments)}")
-        return all_comments
-
     def fetch_issue_data(self) -> Dict[str, Any]:
-        """Fetch issue data from GitHub API"""
+        """Fetch issue data and comments from GitHub API"""
         logger.info("Fetching issue data from GitHub API...")
 
         try:
-            # Fetch issue with body_html format
-            issue_data = self.fetch_issue_html(self.repo, self.issue_number, self.github_token)
+            # Fetch issue and comments with body_html in a single GraphQL query
+            issue_data = self.fetch_issue_graphql()
 
             # Extract and log key metadata
             logger.info(f"  Title: {issue_data.get('title', 'N/A')}")
@@ -442,9 +865,8 @@ class IssueDataFetcher:
             logger.info(f"  Updated: {issue_data.get('updated_at', 'N/A')}")
 
             # Extract labels
-            labels = issue_data.get('labels', [])
-            label_names = [label.get('name', '') for label in labels]
-            logger.info(f"  Labels: {', '.join(label_names) if label_names else 'None'}")
+            label_names = ', '.join(label.get('name', '') for label in issue_data.get('labels', []))
+            logger.info(f"  Labels: {label_names or 'None'}")
 
             # Check for body_html field
             if 'body_html' in issue_data:
@@ -473,27 +895,93 @@ class IssueDataFetcher:
             return issue_data
 
         except RuntimeError:
-            # Re-raise RuntimeError from fetch_issue_html with clear context
+            # fetch_issue_graphql already raises RuntimeError with clear context
             raise
         except Exception as e:
             raise RuntimeError(f"Failed to fetch issue data: {e}") from e
 
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format"""
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+        return _format_file_size(size_bytes)
 
     @retry_on_transient_errors
-    def _download_file(self, url: str) -> bytes:
-        """Download file from URL (with retry logic)"""
-        with urllib.request.urlopen(url, timeout=30) as response:
-            return response.read()
+    def _download_file(self, url: str, output_path: Path) -> int:
+        """Stream file from URL to disk and return its size (with retry logic)"""
+        try:
+            with open_url(url, timeout=30) as response, open(output_path, 'wb') as f:
+                shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+        except Exception:
+            # Remove the partial file so a retry starts clean
+            output_path.unlink(missing_ok=True)
+            raise
+
+        return output_path.stat().st_size
+
+    def _load_previous_download_sizes(self) -> Dict[str, int]:
+        """Map file locations to sizes recorded by a previous run's issue.json"""
+        try:
+            with open(self.output_dir / "issue.json", 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        return {
+            meta['file_location']: meta['file_size_bytes']
+            for meta in previous.get('_download_metadata', [])
+            if meta.get('success') and meta.get('file_location')
+        }
+
+    def _remote_file_size(self, url: str) -> Optional[int]:
+        """
+        Look up an attachment's size without downloading it.
+
+        Uses a one-byte ranged GET rather than HEAD: attachment URLs redirect to
+        storage URLs that are signed for GET only.
+        """
+        request = urllib.request.Request(url, headers={'Range': 'bytes=0-0'})
+        try:
+            with open_url(request, timeout=30) as response:
+                if response.status == 206:
+                    response.read()
+                    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                else:
+                    total = response.headers.get('Content-Length', '')
+        except Exception as e:
+            logger.debug(f"Could not determine size of {url.split('?')[0]}: {e}")
+            return None
+
+        return int(total) if total.isdigit() else None
+
+    def _existing_download_size(self, url: str, output_path: Path) -> Optional[int]:
+        """Return the size of an existing copy of the attachment if it is complete"""
+        if not output_path.is_file():
+            return None
+
+        size = output_path.stat().st_size
+        expected_size = self._previous_download_sizes.get(self._file_location(output_path))
+        if expected_size is None:
+            expected_size = self._remote_file_size(url)
+
+        return size if expected_size == size else None
+
+    def _file_location(self, output_path: Path) -> str:
+        """Absolute path string for a file, without a getcwd() call per file"""
+        if output_path.is_absolute():
+            return os.fspath(output_path)
+        return os.path.join(self._cwd, output_path)
+
+    def _failure_record(self, url: str, output_path: Path, error_msg: str) -> Dict[str, Any]:
+        """Build the download metadata for an attachment that could not be saved"""
+        return {
+            'source_url': url.split('?')[0] if '?' in url else url,
+            'file_type': 'unknown',
+            'file_size': '0 B',
+            'file_size_bytes': 0,
+            'file_location': self._file_location(output_path),
+            'filename': output_path.name,
+            'success': False,
+            'error': error_msg
+        }
 
     def download_attachment(self, url: str, output_path: Path) -> Dict[str, Any]:
         """Download a single attachment from a JWT-authenticated URL"""
@@ -503,16 +991,14 @@ class IssueDataFetcher:
             # Create parent directories if needed
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Download file with timeout and automatic retry on transient errors
-            # Note: JWT tokens are embedded in URL, no additional auth headers needed
-            file_data = self._download_file(url)
-
-            # Write file to disk
-            with open(output_path, 'wb') as f:
-                f.write(file_data)
-
-            # Calculate file size
-            file_size_bytes = len(file_data)
+            # Reuse a complete copy from a previous run instead of downloading again
+            existing_size = self._existing_download_size(url, output_path)
+            if existing_size is not None:
+                file_size_bytes = existing_size
+            else:
+                # Stream file to disk with timeout and automatic retry on transient errors
+                # Note: JWT tokens are embedded in URL, no additional auth headers needed
+                file_size_bytes = self._download_file(url, output_path)
             file_size_human = self.format_file_size(file_size_bytes)
 
             # Extract file type from filename
@@ -521,88 +1007,49 @@ class IssueDataFetcher:
             # Truncate URL for logging (remove JWT parameters)
             source_url_short = url.split('?')[0] if '?' in url else url
 
-            logger.info(f"    ✓ Downloaded {output_path.name} ({file_size_human})")
+            if existing_size is not None:
+                logger.info(f"    ✓ Already downloaded {output_path.name} ({file_size_human}), skipping")
+            else:
+                logger.info(f"    ✓ Downloaded {output_path.name} ({file_size_human})")
 
             return {
                 'source_url': source_url_short,
                 'file_type': file_type,
                 'file_size': file_size_human,
                 'file_size_bytes': file_size_bytes,
-                'file_location': str(output_path.absolute()),
+                'file_location': self._file_location(output_path),
                 'filename': output_path.name,
                 'success': True,
                 'error': None
             }
 
-        except urllib.error.HTTPError as e:
-            error_msg = f"HTTP {e.code}: {e.reason}"
+        except Exception as e:
+            error_msg = describe_download_error(e)
             logger.error(f"    ✗ Failed to download {output_path.name}: {error_msg}")
-            return {
-                'source_url': url.split('?')[0] if '?' in url else url,
-                'file_type': 'unknown',
-                'file_size': '0 B',
-                'file_size_bytes': 0,
-                'file_location': str(output_path.absolute()),
-                'filename': output_path.name,
-                'success': False,
-                'error': error_msg
-            }
+            return self._failure_record(url, output_path, error_msg)
 
-        except urllib.error.URLError as e:
-            error_msg = f"Network error: {e.reason}"
-            logger.error(f"    ✗ Failed to download {output_path.name}: {error_msg}")
-            return {
-                'source_url': url.split('?')[0] if '?' in url else url,
-                'file_type': 'unknown',
-                'file_size': '0 B',
-                'file_size_bytes': 0,
-                'file_location': str(output_path.absolute()),
-                'filename': output_path.name,
-                'success': False,
-                'error': error_msg
-            }
+    def link_attachment(self, source_path: Path, output_path: Path, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Hard-link (or copy) an already downloaded attachment to another location"""
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.unlink(missing_ok=True)
+            try:
+                os.link(source_path, output_path)
+            except OSError:
+                # Cross-device or no hard-link support: fall back to a copy
+                shutil.copyfile(source_path, output_path)
 
-        except TimeoutError as e:
-            error_msg = "Download timed out (30 seconds)"
-            logger.error(f"    ✗ Failed to download {output_path.name}: {error_msg}")
+            logger.info(f"    ✓ Linked duplicate {output_path.name} to {output_path.parent}")
             return {
-                'source_url': url.split('?')[0] if '?' in url else url,
-                'file_type': 'unknown',
-                'file_size': '0 B',
-                'file_size_bytes': 0,
-                'file_location': str(output_path.absolute()),
-                'filename': output_path.name,
-                'success': False,
-                'error': error_msg
+                **metadata,
+                'file_location': self._file_location(output_path),
+                'filename': output_path.name
             }
 
         except OSError as e:
-            error_msg = f"Filesystem error: {e}"
-            logger.error(f"    ✗ Failed to download {output_path.name}: {error_msg}")
-            return {
-                'source_url': url.split('?')[0] if '?' in url else url,
-                'file_type': 'unknown',
-                'file_size': '0 B',
-                'file_size_bytes': 0,
-                'file_location': str(output_path.absolute()),
-                'filename': output_path.name,
-                'success': False,
-                'error': error_msg
-            }
-
-        except Exception as e:
-            error_msg = f"Unexpected error: {e}"
-            logger.error(f"    ✗ Failed to download {output_path.name}: {error_msg}")
-            return {
-                'source_url': url.split('?')[0] if '?' in url else url,
-                'file_type': 'unknown',
-                'file_size': '0 B',
-                'file_size_bytes': 0,
-                'file_location': str(output_path.absolute()),
-                'filename': output_path.name,
-                'success': False,
-                'error': error_msg
-            }
+            error_msg = describe_download_error(e)
+            logger.error(f"    ✗ Failed to link {output_path.name}: {error_msg}")
+            return self._failure_record(metadata['source_url'], output_path, error_msg)
 
     def download_attachments(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
         """Download all attachments from issue and comments"""
@@ -610,77 +1057,91 @@ class IssueDataFetcher:
         logger.info("Downloading attachments...")
         logger.info("=" * 60)
 
-        total_attachments = 0
-        downloaded_count = 0
-        failed_count = 0
-        total_size_bytes = 0
-        download_metadata = []
+        # Sizes from the previous run let existing files skip the download
+        self._previous_download_sizes = self._load_previous_download_sizes()
+
+        # Resolve target directories once so every output path is already absolute
+        issue_attachments_dir = Path(self._file_location(self.issue_attachments_dir))
+        comments_attachments_dir = Path(self._file_location(self.comments_attachments_dir))
+
+        # Collect (url, output_path, source, source_id) for every attachment
+        tasks = []
 
-        # Download issue body attachments
         issue_attachments = issue_data.get('_attachments', [])
         if issue_attachments:
-            logger.info(f"\nDownloading {len(issue_attachments)} attachment(s) from issue body...")
-
-            for idx, attachment in enumerate(issue_attachments, 1):
-                url = attachment['url']
-                filename = attachment['filename']
-                output_path = self.issue_attachments_dir / filename
-
-                logger.info(f"\n  [{idx}/{len(issue_attachments)}] {filename}")
-
-                # Download attachment
-                metadata = self.download_attachment(url, output_path)
-                download_metadata.append({
-                    'source': 'issue',
-                    'source_id': self.issue_number,
-                    **metadata
-                })
-
-                if metadata['success']:
-                    downloaded_count += 1
-                    total_size_bytes += metadata['file_size_bytes']
-                else:
-                    failed_count += 1
-
-                total_attachments += 1
+            logger.info(f"\nQueueing {len(issue_attachments)} attachment(s) from issue body...")
+            for attachment in issue_attachments:
+                output_path = issue_attachments_dir / attachment['filename']
+                tasks.append((attachment['url'], output_path, 'issue', self.issue_number))
 
-        # Download comment attachments
         comments = issue_data.get('_comments', [])
-        if comments:
-            for comment_idx, comment in enumerate(comments, 1):
-                comment_attachments = comment.get('_attachments', [])
-                if not comment_attachments:
-                    continue
+        for comment_idx, comment in enumerate(comments, 1):
+            comment_attachments = comment.get('_attachments', [])
+            if not comment_attachments:
+                continue
 
-                comment_id = comment['comment_id']
-                logger.info(f"\nDownloading {len(comment_attachments)} attachment(s) from comment #{comment_idx} (ID: {comment_id})...")
+            comment_id = comment['comment_id']
+            logger.info(f"\nQueueing {len(comment_attachments)} attachment(s) from comment #{comment_idx} (ID: {comment_id})...")
 
-                # Create comment-specific directory
-                comment_dir = self.comments_attachments_dir / str(comment_id)
+            # Comment-specific directory
+            comment_dir = comments_attachments_dir / str(comment_id)
+            for attachment in comment_attachments:
+                output_path = comment_dir / attachment['filename']
+                tasks.append((attachment['url'], output_path, 'comment', comment_id))
 
-                for idx, attachment in enumerate(comment_attachments, 1):
-                    url = attachment['url']
-                    filename = attachment['filename']
-                    output_path = comment_dir / filename
-
-                    logger.info(f"\n  [{idx}/{len(comment_attachments)}] {filename}")
+        total_attachments = len(tasks)
+        downloaded_count = 0
+        failed_count = 0
+        total_size_bytes = 0
+        download_metadata: List[Optional[Dict[str, Any]]] = [None] * total_attachments
+
+        logger.info(f"\nDownloading {total_attachments} attachment(s) with up to {MAX_DOWNLOAD_WORKERS} workers...")
+
+        # Downloads are I/O-bound, so run them concurrently. Each unique URL (ignoring
+        # the JWT query string, which only signs the same object) is downloaded once;
+        # repeat occurrences are linked to the first copy afterwards. Worker threads are
+        # named after the issue so their log lines can be attributed.
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS,
+                                thread_name_prefix=f"issue-{self.issue_number}") as executor:
+            futures_by_url = {}
+            future_indices = {}
+            for idx, (url, output_path, source, source_id) in enumerate(tasks):
+                url_key = url.split('?', 1)[0]
+                future = futures_by_url.get(url_key)
+                if future is None:
+                    future = executor.submit(self.download_attachment, url, output_path)
+                    futures_by_url[url_key] = future
+                    future_indices[future] = []
+                future_indices[future].append(idx)
+
+            for completed, future in enumerate(as_completed(future_indices), 1):
+                metadata = future.result()
+                logger.info(f"  [{completed}/{len(future_indices)}] {metadata['filename']} finished")
+
+                # Keep metadata in task order so the manifest is deterministic
+                indices = future_indices[future]
+                downloaded_path = tasks[indices[0]][1]
+                for idx in indices:
+                    _, output_path, source, source_id = tasks[idx]
+                    if output_path == downloaded_path:
+                        entry_metadata = metadata
+                    elif metadata['success']:
+                        entry_metadata = self.link_attachment(downloaded_path, output_path, metadata)
+                    else:
+                        entry_metadata = self._failure_record(tasks[idx][0], output_path, metadata['error'])
 
-                    # Download attachment
-                    metadata = self.download_attachment(url, output_path)
-                    download_metadata.append({
-                        'source': 'comment',
-                        'source_id': comment_id,
-                        **metadata
-                    })
+                    download_metadata[idx] = {
+                        'source': source,
+                        'source_id': source_id,
+                        **entry_metadata
+                    }
 
-                    if metadata['success']:
+                    if entry_metadata['success']:
                         downloaded_count += 1
-                        total_size_bytes += metadata['file_size_bytes']
+                        total_size_bytes += entry_metadata['file_size_bytes']
                     else:
                         failed_count += 1
 
-                    total_attachments += 1
-
         # Store download metadata in issue_data
         issue_data['_download_metadata'] = download_metadata
 
@@ -708,200 +1169,165 @@ class IssueDataFetcher:
 
     def format_datetime(self, iso_timestamp: str) -> str:
         """Format ISO 8601 timestamp to human-readable format"""
-        from datetime import datetime
-
-        try:
-            # Parse ISO timestamp
-            dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
-
-            # Format as readable string
-            return dt.strftime("%B %d, %Y at %I:%M %p UTC")
-        except Exception:
-            # Fallback: return original string if parsing fails
-            return iso_timestamp
+        return _format_datetime(iso_timestamp)
 
     def format_dimensions(self, dimensions: Optional[Dict[str, int]]) -> str:
         """Format image dimensions for display"""
         if not dimensions:
             return "N/A"
 
-        width = dimensions.get('width', '?')
-        height = dimensions.get('height', '?')
-        return f"{width}x{height}"
+        # Canonicalize the dict to a hashable (width, height) key for the cache
+        return _format_dimensions(dimensions.get('width', '?'), dimensions.get('height', '?'))
+
+    def _write_comment(self, buf: io.StringIO, idx: int, comment: Dict[str, Any],
+                       comment_attachments: List[Dict[str, Any]]) -> None:
+        """Write a single comment (with its attachments table) to the manifest buffer"""
+        buf.write(
+            f"### Comment #{idx}\n"
+            f"\n"
+            f"- **Author:** @{comment.get('author', 'ghost')}\n"
+            f"- **Posted:** {self.format_datetime(comment.get('created_at', ''))}\n"
+            f"- **Comment ID:** {comment.get('comment_id', 'unknown')}\n"
+            f"\n"
+            f"**Content:**\n"
+            f"\n"
+            f"{comment.get('body', '') or '*No content*'}\n"
+        )
+
+        # Comment Attachments
+        if comment_attachments:
+            comment_dim_map = _dimension_map(comment.get('_attachments', []))
+
+            buf.write(
+                "\n"
+                "**Attachments:**\n"
+                "\n"
+                "| File | Type | Size | Dimensions | Location |\n"
+                "|------|------|------|------------|----------|\n"
+            )
+            buf.writelines(
+                COMMENT_ATTACHMENT_ROW(
+                    meta.get('filename', 'unknown'),
+                    meta.get('file_type', 'unknown'),
+                    meta.get('file_size', '0 B'),
+                    self.format_dimensions(comment_dim_map.get(meta.get('filename', 'unknown'))),
+                    meta.get('file_location', 'N/A')
+                )
+                for meta in comment_attachments
+            )
+
+        buf.write("\n---\n\n")
 
     def generate_manifest(self, issue_data: Dict[str, Any]) -> str:
         """Generate LLM-friendly markdown manifest from issue data"""
-        lines = []
-
-        # Issue Header
-        lines.append(f"# Issue #{self.issue_number}: {issue_data.get('title', 'N/A')}")
-        lines.append("")
-        lines.append("## Issue Metadata")
-        lines.append("")
-        lines.append(f"- **Repository:** {self.repo}")
-        lines.append(f"- **Issue Number:** #{self.issue_number}")
-        lines.append(f"- **State:** {issue_data.get('state', 'N/A')}")
-        lines.append(f"- **Created:** {self.format_datetime(issue_data.get('created_at', ''))}")
-        lines.append(f"- **Updated:** {self.format_datetime(issue_data.get('updated_at', ''))}")
-
-        # Author
         user = issue_data.get('user', {})
         author = user.get('login', 'N/A') if user else 'N/A'
-        lines.append(f"- **Author:** @{author}")
-
-        # Labels
-        labels = issue_data.get('labels', [])
-        if labels:
-            label_names = [label.get('name', '') for label in labels]
-            lines.append(f"- **Labels:** {', '.join(label_names)}")
-        else:
-            lines.append("- **Labels:** None")
-
-        lines.append("")
-
-        # Issue Body
-        lines.append("## Issue Body")
-        lines.append("")
-        body = issue_data.get('body', '')
-        if body:
-            lines.append(body)
-        else:
-            lines.append("*No description provided*")
-        lines.append("")
+        label_names = ', '.join(label.get('name', '') for label in issue_data.get('labels', [])) or 'None'
+
+        # Write sections straight into one buffer instead of collecting lines to join
+        buf = io.StringIO()
+        w = buf.write
+
+        # Issue Header
+        w(
+            f"# Issue #{self.issue_number}: {issue_data.get('title', 'N/A')}\n"
+            f"\n"
+            f"## Issue Metadata\n"
+            f"\n"
+            f"- **Repository:** {self.repo}\n"
+            f"- **Issue Number:** #{self.issue_number}\n"
+            f"- **State:** {issue_data.get('state', 'N/A')}\n"
+            f"- **Created:** {self.format_datetime(issue_data.get('created_at', ''))}\n"
+            f"- **Updated:** {self.format_datetime(issue_data.get('updated_at', ''))}\n"
+            f"- **Author:** @{author}\n"
+            f"- **Labels:** {label_names}\n"
+            f"\n"
+            # Issue Body
+            f"## Issue Body\n"
+            f"\n"
+            f"{issue_data.get('body', '') or '*No description provided*'}\n"
+            f"\n"
+        )
 
         # Issue Attachments
         download_metadata = issue_data.get('_download_metadata', [])
-        issue_attachments = [meta for meta in download_metadata if meta.get('source') == 'issue']
 
-        if issue_attachments:
-            lines.append("## Issue Attachments")
-            lines.append("")
-            lines.append("| File | Type | Size | Dimensions | Uploaded By | Location |")
-            lines.append("|------|------|------|------------|-------------|----------|")
+        # Group download metadata by origin once: ('issue', None) or ('comment', comment_id)
+        metadata_by_source = {}
+        for meta in download_metadata:
+            source = meta.get('source')
+            key = (source, None if source == 'issue' else meta.get('source_id'))
+            metadata_by_source.setdefault(key, []).append(meta)
 
-            for meta in issue_attachments:
-                filename = meta.get('filename', 'unknown')
-                file_type = meta.get('file_type', 'unknown')
-                file_size = meta.get('file_size', '0 B')
-                file_location = meta.get('file_location', 'N/A')
-
-                # Get dimensions from original attachment metadata if available
-                # Prioritize attachments with dimensions (img tags) over those without (a tags)
-                dimensions = "N/A"
-                issue_attachments_list = issue_data.get('_attachments', [])
-                for att in issue_attachments_list:
-                    if att['filename'] == filename:
-                        att_dims = att.get('dimensions')
-                        if att_dims:
-                            dimensions = self.format_dimensions(att_dims)
-                            break
-                        elif dimensions == "N/A":
-                            dimensions = self.format_dimensions(att_dims)
-
-                lines.append(f"| {filename} | {file_type} | {file_size} | {dimensions} | @{author} | `{file_location}` |")
-
-            lines.append("")
+        issue_attachments = metadata_by_source.get(('issue', None), [])
+
+        if issue_attachments:
+            issue_dim_map = _dimension_map(issue_data.get('_attachments', []))
+
+            w(
+                "## Issue Attachments\n"
+                "\n"
+                "| File | Type | Size | Dimensions | Uploaded By | Location |\n"
+                "|------|------|------|------------|-------------|----------|\n"
+            )
+            buf.writelines(
+                ISSUE_ATTACHMENT_ROW(
+                    meta.get('filename', 'unknown'),
+                    meta.get('file_type', 'unknown'),
+                    meta.get('file_size', '0 B'),
+                    self.format_dimensions(issue_dim_map.get(meta.get('filename', 'unknown'))),
+                    author,
+                    meta.get('file_location', 'N/A')
+                )
+                for meta in issue_attachments
+            )
+            w("\n")
 
         # Comments Section
         comments = issue_data.get('_comments', [])
         if comments:
-            lines.append(f"## Comments ({len(comments)})")
-            lines.append("")
-
+            w(f"## Comments ({len(comments)})\n\n")
             for idx, comment in enumerate(comments, 1):
                 comment_id = comment.get('comment_id', 'unknown')
-                comment_author = comment.get('author', 'ghost')
-                comment_created = self.format_datetime(comment.get('created_at', ''))
-                comment_body = comment.get('body', '')
-
-                lines.append(f"### Comment #{idx}")
-                lines.append("")
-                lines.append(f"- **Author:** @{comment_author}")
-                lines.append(f"- **Posted:** {comment_created}")
-                lines.append(f"- **Comment ID:** {comment_id}")
-                lines.append("")
-                lines.append("**Content:**")
-                lines.append("")
-                if comment_body:
-                    lines.append(comment_body)
-                else:
-                    lines.append("*No content*")
-                lines.append("")
-
-                # Comment Attachments
-                comment_attachments = [meta for meta in download_metadata if meta.get('source') == 'comment' and meta.get('source_id') == comment_id]
-
-                if comment_attachments:
-                    lines.append("**Attachments:**")
-                    lines.append("")
-                    lines.append("| File | Type | Size | Dimensions | Location |")
-                    lines.append("|------|------|------|------------|----------|")
-
-                    for meta in comment_attachments:
-                        filename = meta.get('filename', 'unknown')
-                        file_type = meta.get('file_type', 'unknown')
-                        file_size = meta.get('file_size', '0 B')
-                        file_location = meta.get('file_location', 'N/A')
-
-                        # Get dimensions from comment attachment metadata
-                        # Prioritize attachments with dimensions (img tags) over those without (a tags)
-                        dimensions = "N/A"
-                        comment_attachments_list = comment.get('_attachments', [])
-                        for att in comment_attachments_list:
-                            if att['filename'] == filename:
-                                att_dims = att.get('dimensions')
-                                if att_dims:
-                                    dimensions = self.format_dimensions(att_dims)
-                                    break
-                                elif dimensions == "N/A":
-                                    dimensions = self.format_dimensions(att_dims)
-
-                        lines.append(f"| {filename} | {file_type} | {file_size} | {dimensions} | `{file_location}` |")
-
-                    lines.append("")
-
-                lines.append("---")
-                lines.append("")
+                self._write_comment(buf, idx, comment, metadata_by_source.get(('comment', comment_id), []))
 
-        # Summary Section
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- **Total Comments:** {len(comments)}")
-
-        # Calculate attachment statistics
+        # Calculate attachment statistics (counts, file types and size) in one pass
         total_attachments = len(download_metadata)
-        successful_downloads = len([m for m in download_metadata if m.get('success', False)])
-        failed_downloads = len([m for m in download_metadata if not m.get('success', False)])
-
-        # Count by file type
+        successful_downloads = 0
+        total_size_bytes = 0
         file_types = {}
         for meta in download_metadata:
             if meta.get('success', False):
+                successful_downloads += 1
+                total_size_bytes += meta.get('file_size_bytes', 0)
                 file_type = meta.get('file_type', 'unknown')
                 file_types[file_type] = file_types.get(file_type, 0) + 1
-
-        # Calculate total size
-        total_size_bytes = sum(meta.get('file_size_bytes', 0) for meta in download_metadata if meta.get('success', False))
+        failed_downloads = total_attachments - successful_downloads
         total_size_human = self.format_file_size(total_size_bytes)
 
-        lines.append(f"- **Total Attachments:** {total_attachments}")
-        lines.append(f"- **Successfully Downloaded:** {successful_downloads}")
+        # Summary Section
+        w(
+            f"## Summary\n"
+            f"\n"
+            f"- **Total Comments:** {len(comments)}\n"
+            f"- **Total Attachments:** {total_attachments}\n"
+            f"- **Successfully Downloaded:** {successful_downloads}\n"
+        )
         if failed_downloads > 0:
-            lines.append(f"- **Failed Downloads:** {failed_downloads}")
-
+            w(f"- **Failed Downloads:** {failed_downloads}\n")
         if file_types:
-            file_type_summary = ', '.join([f"{count} {ftype}" for ftype, count in sorted(file_types.items())])
-            lines.append(f"- **File Types:** {file_type_summary}")
-
-        lines.append(f"- **Total Size:** {total_size_human}")
-        lines.append("")
-
-        # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append(f"*Generated by fetch-issue-complete.py on {self.format_datetime(issue_data.get('updated_at', ''))}*")
+            file_type_summary = ', '.join(f"{count} {ftype}" for ftype, count in sorted(file_types.items()))
+            w(f"- **File Types:** {file_type_summary}\n")
+        w(
+            f"- **Total Size:** {total_size_human}\n"
+            f"\n"
+            # Footer
+            f"---\n"
+            f"\n"
+            f"*Generated by fetch-issue-complete.py on {self.format_datetime(issue_data.get('updated_at', ''))}*"
+        )
 
-        return '\n'.join(lines)
+        return buf.getvalue()
 
     def save_manifest(self, issue_data: Dict[str, Any]) -> None:
         """Generate and save manifest.md file"""
@@ -909,10 +1335,7 @@ class IssueDataFetcher:
         logger.info(f"Generating manifest: {manifest_file}...")
 
         try:
-            manifest_content = self.generate_manifest(issue_data)
-
-            with open(manifest_file, 'w', encoding='utf-8') as f:
-                f.write(manifest_content)
+            manifest_file.write_text(self.generate_manifest(issue_data), encoding='utf-8')
 
             logger.info(f"✓ Saved: {manifest_file}")
         except OSError as e:
@@ -925,13 +1348,72 @@ class IssueDataFetcher:
         logger.info(f"Saving issue data to {output_file}...")
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(issue_data, f, indent=2, ensure_ascii=False)
+            # Serialize up front so the file is written in one call rather than
+            # json.dump's many small writes; compact unless --pretty was given
+            output_file.write_bytes(json_dumps_bytes(issue_data, pretty=self.pretty))
             logger.info(f"✓ Saved: {output_file}")
         except OSError as e:
             logger.error(f"Failed to save issue data: {e}")
             raise
 
+    def compute_content_hash(self, issue_data: Dict[str, Any]) -> str:
+        """
+        Hash issue and comment content, plus the options that shape the output.
+
+        Rendered HTML (and the attachments parsed from it) is excluded because its
+        JWT-signed attachment URLs change on every fetch; the markdown bodies still
+        capture any edit. The issue.json format is included so switching --pretty
+        on or off regenerates the output.
+        """
+        volatile_keys = ('body_html', '_attachments')
+        content = {k: v for k, v in issue_data.items() if k not in volatile_keys}
+        content['_comments'] = [
+            {k: v for k, v in comment.items() if k not in volatile_keys}
+            for comment in issue_data.get('_comments', [])
+        ]
+        content['_pretty'] = self.pretty
+        serialized = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    def _recorded_downloads_present(self) -> bool:
+        """Check that every attachment recorded in issue.json was downloaded and is still on disk"""
+        try:
+            previous = json_loads((self.output_dir / "issue.json").read_bytes())
+        except (OSError, ValueError):
+            return False
+
+        return all(
+            meta.get('success') and os.path.exists(meta.get('file_location') or '')
+            for meta in previous.get('_download_metadata', [])
+        )
+
+    def is_up_to_date(self, content_hash: str) -> bool:
+        """Check whether the saved output was generated from the same content and is complete"""
+        if not (self.output_dir / "manifest.md").exists():
+            return False
+
+        try:
+            if self.content_hash_file.read_text(encoding='utf-8').strip() != content_hash:
+                return False
+        except OSError:
+            return False
+
+        return self._recorded_downloads_present()
+
+    def save_content_hash(self, content_hash: str) -> None:
+        """Record the content hash of the saved output"""
+        try:
+            self.content_hash_file.write_text(content_hash, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Failed to save content hash: {e}")
+
+    def clear_content_hash(self) -> None:
+        """Forget the recorded content hash so the next run regenerates the output"""
+        try:
+            self.content_hash_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove content hash: {e}")
+
     def run(self) -> None:
         """Main execution flow"""
         try:
@@ -944,9 +1426,18 @@ class IssueDataFetcher:
             # Step 3: Fetch issue data
             issue_data = self.fetch_issue_data()
 
-            # Step 4: Fetch comments
+            # Skip attachments and manifest when nothing changed since the last run
+            content_hash = self.compute_content_hash(issue_data)
+            if not self.force and self.is_up_to_date(content_hash):
+                logger.info("\n" + "=" * 60)
+                logger.info(f"Issue #{self.issue_number} is up to date (content unchanged), skipping")
+                logger.info(f"  Manifest: {self.output_dir / 'manifest.md'}")
+                logger.info("  Use --force to regenerate")
+                return
+
+            # Step 4: Process comments (fetched together with the issue)
             logger.info("\n" + "=" * 60)
-            comments = self.fetch_comments_html(self.repo, self.issue_number, self.github_token)
+            comments = issue_data.pop('_comments', [])
 
             if comments:
                 logger.info(f"\n✓ Fetched {len(comments)} comment(s)")
@@ -998,6 +1489,11 @@ class IssueDataFetcher:
             logger.info("\n" + "=" * 60)
             self.save_issue_data(issue_data)
             self.save_manifest(issue_data)
+            # Only mark the output current when it is complete, so failed downloads are retried
+            if download_stats['failed'] == 0:
+                self.save_content_hash(content_hash)
+            else:
+                self.clear_content_hash()
 
             # Summary
             logger.info("=" * 60)
@@ -1063,6 +1559,18 @@ Examples:
         help='GitHub personal access token (or use GITHUB_TOKEN env var)'
     )
 
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate output even if the issue content is unchanged'
+    )
+
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent issue.json for reading (default: compact)'
+    )
+
     return parser.parse_args()
 
 
@@ -1081,7 +1589,9 @@ def main() -> int:
             repo=args.repo,
             issue_number=args.issue,
             output_dir=args.output_dir,
-            github_token=args.github_token
+            github_token=args.github_token,
+            force=args.force,
+            pretty=args.pretty
         )
 
         # Run the fetcher
@@ -5,39 +5,81 @@ Finds issues matching criteria and fetches complete data for each.
 """
 
 import argparse
+import importlib.util
 import json
+import logging
 import os
+import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+# Issues fetched concurrently; kept low to stay clear of GitHub's secondary rate limits
+MAX_FETCH_WORKERS = 8
 
-def run_command(cmd, capture_output=True, max_attempts=3, backoff_base=2):
-    """Execute command with retry logic for transient failures."""
+# Locations searched for fetch-issue-complete.py, resolved once at import
+SCRIPT_PATHS = (
+    ".ai-tools-resources/scripts/github-utils/fetch-issue-complete.py",
+    "scripts/github-utils/fetch-issue-complete.py",
+    "/tmp/fetch-issue-complete.py"
+)
+_SCRIPT = next((path for path in SCRIPT_PATHS if os.path.exists(path)), None)
+
+# Threads working on an issue are named "issue-<number>" (download workers get a suffix)
+ISSUE_THREAD_RE = re.compile(r'issue-(\d+)')
+
+
+class IssueLogFilter(logging.Filter):
+    """Prefix fetcher log lines with the issue the logging thread is working on."""
+
+    def filter(self, record):
+        match = ISSUE_THREAD_RE.match(record.threadName or "")
+        if match:
+            # Keep leading blank lines (section separators) ahead of the prefix
+            message = str(record.msg)
+            body = message.lstrip("\n")
+            record.msg = f"{message[:len(message) - len(body)]}[#{match.group(1)}] {body}"
+        return True
+
+
+def stream_command_lines(cmd, max_attempts=3, backoff_base=2):
+    """Run an argv command list with retry logic, yielding stdout lines as they arrive.
+
+    The command's stderr passes straight through. Retries only if the command
+    fails before producing output, since earlier lines have already been
+    consumed; otherwise raises CalledProcessError.
+    """
     for attempt in range(1, max_attempts + 1):
-        result = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            shell=True,
-            capture_output=capture_output,
+            stdout=subprocess.PIPE,
             text=True
         )
 
-        if result.returncode == 0:
-            return result
+        yielded = False
+        for line in process.stdout:
+            yielded = True
+            yield line
+
+        returncode = process.wait()
 
-        if attempt == max_attempts:
-            return result
+        if returncode == 0:
+            return
+
+        if yielded or attempt == max_attempts:
+            raise subprocess.CalledProcessError(returncode, cmd)
 
         wait_time = backoff_base ** attempt
-        print(f"Attempt {attempt}/{max_attempts} failed (exit {result.returncode}), retrying in {wait_time}s...", file=sys.stderr)
+        print(f"Attempt {attempt}/{max_attempts} failed (exit {returncode}), retrying in {wait_time}s...", file=sys.stderr)
         time.sleep(wait_time)
 
-    return result
-
 
 def fetch_matching_issues(repo, label=None, state="open", limit=100):
-    """Find issues matching criteria using gh CLI."""
+    """Yield issues matching criteria using gh CLI, one at a time as they are parsed."""
 
     # Build search query
     query_parts = [f"repo:{repo}"]
@@ -50,48 +92,57 @@ def fetch_matching_issues(repo, label=None, state="open", limit=100):
 
     query = " ".join(query_parts)
 
-    # Fetch issues using gh CLI
-    cmd = f"""gh issue list \
-        --repo {repo} \
-        --search '{query}' \
-        --limit {limit} \
-        --json number,title,state,labels,createdAt,updatedAt \
-        --jq '.'"""
-
-    result = run_command(cmd)
-
-    if result.returncode != 0:
-        print(f"Error fetching issues: {result.stderr}", file=sys.stderr)
-        return []
+    # Fetch issues using gh CLI; an argv list needs no shell or quoting around the query.
+    # --jq '.[]' emits one issue per line so each can be parsed (and dispatched) on its own
+    cmd = [
+        "gh", "issue", "list",
+        "--repo", repo,
+        "--search", query,
+        "--limit", str(limit),
+        "--json", "number,title,state,labels,createdAt,updatedAt",
+        "--jq", ".[]"
+    ]
 
     try:
-        issues = json.loads(result.stdout)
-        return issues
-    except json.JSONDecodeError as e:
-        print(f"Error parsing JSON: {e}", file=sys.stderr)
-        return []
+        for line in stream_command_lines(cmd):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"Error parsing JSON: {e}", file=sys.stderr)
+    except subprocess.CalledProcessError as e:
+        print(f"Error fetching issues (exit {e.returncode})", file=sys.stderr)
+
+
+@lru_cache(maxsize=None)
+def load_issue_fetcher():
+    """Import IssueDataFetcher from fetch-issue-complete.py once per process."""
+
+    if not _SCRIPT:
+        print(f"ERROR: fetch-issue-complete.py not found", file=sys.stderr)
+        return None
 
+    # The filename has hyphens, so load it from its path rather than via a plain import
+    spec = importlib.util.spec_from_file_location("fetch_issue_complete", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
 
-def fetch_issue_complete(repo, issue_number, output_dir):
-    """Fetch complete issue data using fetch-issue-complete.py."""
+    # Several issues log through this logger at once; tag each line with its issue
+    module.logger.addFilter(IssueLogFilter())
+    return module.IssueDataFetcher
 
-    # Locate fetch-issue-complete.py script
-    script_paths = [
-        ".ai-tools-resources/scripts/github-utils/fetch-issue-complete.py",
-        "scripts/github-utils/fetch-issue-complete.py",
-        "/tmp/fetch-issue-complete.py"
-    ]
 
-    script = None
-    for path in script_paths:
-        if os.path.exists(path):
-            script = path
-            break
+def fetch_issue_complete(repo, issue_number, output_dir):
+    """Fetch complete issue data in-process with IssueDataFetcher."""
 
-    if not script:
-        print(f"ERROR: fetch-issue-complete.py not found", file=sys.stderr)
+    fetcher_class = load_issue_fetcher()
+    if fetcher_class is None:
         return False
 
+    # Name the worker thread after the issue so IssueLogFilter can tag its log lines
+    threading.current_thread().name = f"issue-{issue_number}"
+
     # Get GitHub token from environment
     github_token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
     if not github_token:
@@ -102,11 +153,20 @@ def fetch_issue_complete(repo, issue_number, output_dir):
     issue_dir = Path(output_dir) / str(issue_number)
     issue_dir.mkdir(parents=True, exist_ok=True)
 
-    # Fetch complete issue data with proper named arguments
-    cmd = f"python3 {script} --repo {repo} --issue {issue_number} --output-dir {issue_dir} --github-token {github_token}"
-    result = run_command(cmd, capture_output=False)
+    # Fetch complete issue data; the fetcher's connection pool keeps each worker's
+    # HTTPS connection alive across issues
+    try:
+        fetcher_class(
+            repo=repo,
+            issue_number=issue_number,
+            output_dir=str(issue_dir),
+            github_token=github_token
+        ).run()
+    except Exception as e:
+        print(f"ERROR: issue #{issue_number}: {e}", file=sys.stderr)
+        return False
 
-    return result.returncode == 0
+    return True
 
 
 def create_manifest(issues, output_dir):
@@ -176,48 +236,61 @@ def main():
     print(f"  Limit: {args.limit}")
     print()
 
-    # Find matching issues
-    issues = fetch_matching_issues(
-        args.repo,
-        label=args.label,
-        state=args.state,
-        limit=args.limit
-    )
-
-    if not issues:
-        print("No issues found matching criteria")
-
-        # Create empty manifest
-        output_dir = Path(args.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        create_manifest([], args.output_dir)
-        sys.exit(0)
-
-    print(f"Found {len(issues)} issues")
-    print()
-
     # Create output directory
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Fetch complete data for each issue
+    issues = []
     success_count = 0
     fail_count = 0
 
-    for issue in issues:
-        number = issue["number"]
-        title = issue["title"]
+    # Each fetch is network-bound and independent, so overlap them in a thread pool,
+    # dispatching issues as soon as gh emits them
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        futures = {}
+        for issue in fetch_matching_issues(
+            args.repo,
+            label=args.label,
+            state=args.state,
+            limit=args.limit
+        ):
+            # Import the fetcher before the first submit so worker threads share one loaded module
+            if not issues and load_issue_fetcher() is None:
+                sys.exit(1)
+
+            issues.append(issue)
+            print(f"Fetching issue #{issue['number']}: {issue['title']}")
+            future = executor.submit(fetch_issue_complete, args.repo, issue["number"], args.output_dir)
+            futures[future] = issue
+
+        if not issues:
+            print("No issues found matching criteria")
+
+            # Create empty manifest
+            create_manifest([], args.output_dir)
+            sys.exit(0)
 
-        print(f"Fetching issue #{number}: {title}")
+        print()
+        print(f"Found {len(issues)} issues")
+        print()
 
-        if fetch_issue_complete(args.repo, number, args.output_dir):
-            success_count += 1
-            print(f"  ✓ Complete")
-        else:
-            fail_count += 1
-            print(f"  ✗ Failed")
+        for future in as_completed(futures):
+            number = futures[future]["number"]
+            try:
+                ok = future.result()
+            except Exception as e:
+                print(f"  Error fetching issue #{number}: {e}", file=sys.stderr)
+                ok = False
+
+            if ok:
+                success_count += 1
+                print(f"  ✓ Issue #{number} complete")
+            else:
+                fail_count += 1
+                print(f"  ✗ Issue #{number} failed")
 
-        print()
+    print()
 
     # Create manifest
     create_manifest(issues, args.output_dir)
@@ -10,34 +10,255 @@ import subprocess
 import sys
 import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
-def run_gh_command(command, max_attempts=3, backoff_base=2):
-    """Run gh CLI command with retry logic and return JSON result"""
+# Incremental cache (enabled by ISSUE_CACHE_DIR): deltas are fetched with ?since=<cursor>, with a full refetch at this interval
+# so deleted or transferred issues (which never show up in a delta) eventually drop out
+FULL_REFRESH_INTERVAL = timedelta(days=1)
+CURSOR_FILE = 'cursor.json'
+ISSUES_CACHE_FILE = 'issues-cache.json'
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Priority levels in precedence order (lower rank wins) and the exact label names mapping to them
+PRIORITY_LEVELS = ("critical", "high", "medium", "low")
+UNPRIORITIZED_RANK = len(PRIORITY_LEVELS)
+PRIORITY_MAP = {
+    alias: rank
+    for rank, level in enumerate(PRIORITY_LEVELS)
+    for alias in (level, f"priority:{level}", f"priority: {level}", f"priority-{level}", f"p{rank}")
+}
+
+# GitHub timestamps end in 'Z', which fromisoformat only accepts natively on 3.11+
+if sys.version_info >= (3, 11):
+    _PARSE = datetime.fromisoformat
+else:
+    def _PARSE(timestamp):
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+def priority_rank(label_name):
+    """Return the precedence rank of a lowercased label name, or None if it carries no priority"""
+    rank = PRIORITY_MAP.get(label_name)
+    if rank is not None:
+        return rank
+
+    # Fall back to substring matching for un-normalized labels
+    for rank, level in enumerate(PRIORITY_LEVELS):
+        if level in label_name:
+            return rank
+    return None
+
+@lru_cache(maxsize=None)
+def classify_label(name):
+    """Return (lowercased name, priority rank or None, area or None) for a label name
+
+    The same few labels repeat across every issue, so each distinct name is classified once.
+    """
+    label_name = name.lower()
+    area = label_name.replace('area:', '').strip() if label_name.startswith('area:') else None
+    return label_name, priority_rank(label_name), area
+
+def stream_gh_json(command, max_attempts=3, backoff_base=2):
+    """Run a gh CLI argv list with retry logic and yield one JSON value per output line
+
+    Use with `-q '.[]'` so gh emits one issue per line as pages arrive; gh's stderr
+    passes straight through. Retries only if the command fails before producing
+    output, since earlier items have already been consumed; otherwise raises
+    CalledProcessError once the failure is reported.
+    """
     for attempt in range(1, max_attempts + 1):
-        result = subprocess.run(
+        process = subprocess.Popen(
             command,
-            shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
             text=True,
             env=os.environ
         )
 
-        if result.returncode == 0:
+        yielded = False
+        for line in process.stdout:
+            if not line.strip():
+                continue
             try:
-                return json.loads(result.stdout)
+                value = json.loads(line)
             except json.JSONDecodeError:
-                return None
+                continue
+            yielded = True
+            yield value
+
+        returncode = process.wait()
+
+        if returncode == 0:
+            return
 
-        if attempt == max_attempts:
-            print(f"Error running: {command}", file=sys.stderr)
-            print(f"Error: {result.stderr}", file=sys.stderr)
-            return None
+        if yielded or attempt == max_attempts:
+            print(f"Error running: {' '.join(command)} (exit {returncode})", file=sys.stderr)
+            raise subprocess.CalledProcessError(returncode, command)
 
         wait_time = backoff_base ** attempt
-        print(f"Attempt {attempt}/{max_attempts} failed (exit {result.returncode}), retrying in {wait_time}s...", file=sys.stderr)
+        print(f"Attempt {attempt}/{max_attempts} failed (exit {returncode}), retrying in {wait_time}s...", file=sys.stderr)
         time.sleep(wait_time)
 
-    return None
+def slim_issue(issue):
+    """Keep only the fields the report needs, so the cached issue set stays small"""
+    return {
+        "number": issue['number'],
+        "title": issue['title'],
+        "html_url": issue['html_url'],
+        "created_at": issue['created_at'],
+        "updated_at": issue.get('updated_at'),
+        "closed_at": issue.get('closed_at'),
+        "labels": [label['name'] for label in issue.get('labels', [])]
+    }
+
+def stream_issues(command, message):
+    """Print message, then yield slim records for the issues gh streams, skipping pull requests
+
+    Stops early if gh fails (stream_gh_json has already reported the error).
+    """
+    print(message)
+    try:
+        for issue in stream_gh_json(command):
+            if isinstance(issue, dict) and 'pull_request' not in issue:
+                yield slim_issue(issue)
+    except subprocess.CalledProcessError:
+        return
+
+def merge_issues(command, open_issues, closed_issues):
+    """Stream issues from gh into the open/closed maps keyed by number
+
+    Issues move between the maps when their state changes. Returns False if gh failed.
+    """
+    try:
+        for issue in stream_gh_json(command):
+            if not isinstance(issue, dict) or 'pull_request' in issue:
+                continue
+            number = issue['number']
+            if issue.get('state') == 'closed':
+                open_issues.pop(number, None)
+                closed_issues[number] = slim_issue(issue)
+            else:
+                closed_issues.pop(number, None)
+                open_issues[number] = slim_issue(issue)
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+def load_cache(cache_dir, repo, now):
+    """Return (last_updated, full_refresh_at, open_issues, closed_issues) from a usable cache, or None"""
+    try:
+        with open(os.path.join(cache_dir, CURSOR_FILE)) as f:
+            cursor = json.load(f)
+        with open(os.path.join(cache_dir, ISSUES_CACHE_FILE)) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cursor.get('repository') != repo or not cursor.get('last_updated'):
+        return None
+
+    try:
+        full_refresh_at = _PARSE(cursor['full_refresh_at'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if now - full_refresh_at >= FULL_REFRESH_INTERVAL:
+        return None
+
+    open_issues = {issue['number']: issue for issue in cached.get('open', [])}
+    closed_issues = {issue['number']: issue for issue in cached.get('closed', [])}
+    return cursor['last_updated'], cursor['full_refresh_at'], open_issues, closed_issues
+
+def save_cache(cache_dir, repo, last_updated, full_refresh_at, open_issues, closed_issues):
+    """Persist the merged issue set and the cursor for the next incremental run"""
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, ISSUES_CACHE_FILE), 'w') as f:
+        json.dump({"open": list(open_issues.values()), "closed": list(closed_issues.values())}, f)
+    with open(os.path.join(cache_dir, CURSOR_FILE), 'w') as f:
+        json.dump({
+            "repository": repo,
+            "last_updated": last_updated,
+            "full_refresh_at": full_refresh_at
+        }, f, indent=2)
+
+def add_open_issue(stats, issue, now):
+    """Fold one open issue (slim record) into the statistics"""
+    open_stats = stats["open_issues"]
+    open_stats["total"] += 1
+
+    created = _PARSE(issue['created_at'])
+    age_days = (now - created).days
+
+    # Single pass over labels: priority, plus sets of normalized names and areas so
+    # labels differing only in case or spacing count once per issue
+    rank = UNPRIORITIZED_RANK
+    label_set = set()
+    areas = set()
+    for name in issue['labels']:
+        label_name, label_rank, area = classify_label(name)
+        label_set.add(label_name)
+
+        # Keep the highest priority seen
+        if label_rank is not None and label_rank < rank:
+            rank = label_rank
+
+        if area is not None:
+            areas.add(area)
+
+    # Count by area and type
+    by_area = open_stats["by_area"]
+    for area in areas:
+        by_area[area] = by_area.get(area, 0) + 1
+    if 'bug' in label_set:
+        open_stats["with_bug_label"] += 1
+    if 'enhancement' in label_set:
+        open_stats["with_enhancement_label"] += 1
+
+    priority = PRIORITY_LEVELS[rank] if rank < UNPRIORITIZED_RANK else "unprioritized"
+    open_stats["by_priority"][priority] += 1
+
+    # Categorize by age
+    by_age = open_stats["by_age"]
+    if age_days < 1:
+        by_age["new"] += 1
+    elif age_days <= 7:
+        by_age["recent"] += 1
+    elif age_days <= 30:
+        by_age["active"] += 1
+    elif age_days <= 90:
+        by_age["stale"] += 1
+    else:
+        by_age["ancient"] += 1
+
+    # Add to issues list
+    stats["issues"]["open"].append({
+        "number": issue['number'],
+        "title": issue['title'],
+        "url": issue['html_url'],
+        "created_at": issue['created_at'],
+        "age_days": age_days,
+        "priority": priority,
+        "labels": issue['labels']
+    })
+
+def add_closed_issue(stats, issue):
+    """Fold one recently closed issue (slim record) into the statistics
+
+    Returns the hours it took to close, or None when closed_at is missing.
+    """
+    stats["closed_last_7_days"]["total"] += 1
+    if not issue.get('closed_at'):
+        return None
+
+    created = _PARSE(issue['created_at'])
+    closed = _PARSE(issue['closed_at'])
+    time_to_close = (closed - created).total_seconds() / 3600  # in hours
+
+    stats["issues"]["recently_closed"].append({
+        "number": issue['number'],
+        "title": issue['title'],
+        "url": issue['html_url'],
+        "closed_at": issue['closed_at'],
+        "time_to_close_hours": round(time_to_close, 1)
+    })
+    return time_to_close
 
 # Get repository info from environment
 repo = os.environ.get('GITHUB_REPOSITORY', '')
@@ -47,41 +268,66 @@ if not repo:
 
 print(f"Repository: {repo}")
 
-# Get all open issues
-print("Fetching open issues...")
-open_issues = run_gh_command(
-    f'gh api repos/{repo}/issues --paginate -q "."'
-)
+# Output directory from environment or default
+output_dir = os.environ.get('OUTPUT_DIR', '/tmp/issue-data')
+
+# Incremental caching is opt-in and kept apart from the report artifacts in OUTPUT_DIR
+cache_dir = os.environ.get('ISSUE_CACHE_DIR')
+
+# Cursor for the next run; taken before fetching so updates made mid-fetch are picked up next time
+now = datetime.now(timezone.utc)
+fetch_started = now.strftime(TIMESTAMP_FORMAT)
+week_ago = (now - timedelta(days=7)).strftime(TIMESTAMP_FORMAT)
+
+open_command = ['gh', 'api', f'repos/{repo}/issues', '--paginate', '-q', '.[]']
+closed_command = ['gh', 'api', f'repos/{repo}/issues?state=closed&since={week_ago}', '--paginate', '-q', '.[]']
+
+if cache_dir:
+    # Cached runs hold the (slim) open and recently closed sets in memory so deltas can be merged
+    cache = load_cache(cache_dir, repo, now)
+    if cache:
+        # Incremental run: only issues updated since the last cursor, in either state
+        last_updated, full_refresh_at, open_by_number, closed_by_number = cache
+        print(f"Fetching issues updated since {last_updated} (incremental)...")
+        fetched = merge_issues(
+            ['gh', 'api', f'repos/{repo}/issues?state=all&since={last_updated}', '--paginate', '-q', '.[]'],
+            open_by_number, closed_by_number
+        )
+    else:
+        full_refresh_at = fetch_started
+        open_by_number = {}
+        closed_by_number = {}
 
-if not open_issues:
-    open_issues = []
-elif not isinstance(open_issues, list):
-    open_issues = [open_issues]
+        # Get all open issues
+        print("Fetching open issues...")
+        fetched = merge_issues(open_command, open_by_number, closed_by_number)
 
-# Filter out pull requests
-open_issues = [i for i in open_issues if isinstance(i, dict) and 'pull_request' not in i]
+        # Get recently closed issues (last 7 days)
+        print(f"Fetching issues closed since {week_ago}...")
+        fetched = merge_issues(closed_command, open_by_number, closed_by_number) and fetched
 
-# Get recently closed issues (last 7 days)
-week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
-print(f"Fetching issues closed since {week_ago}...")
-closed_issues = run_gh_command(
-    f'gh api repos/{repo}/issues?state=closed&since={week_ago} --paginate -q "."'
-)
+    # Recently closed means updated within the last 7 days, matching the full fetch's since= filter
+    for number in [n for n, issue in closed_by_number.items() if (issue['updated_at'] or '') < week_ago]:
+        del closed_by_number[number]
 
-if not closed_issues:
-    closed_issues = []
-elif not isinstance(closed_issues, list):
-    closed_issues = [closed_issues]
+    # Only advance the cursor when every fetch succeeded, so a failed run is retried from the old one
+    if fetched:
+        save_cache(cache_dir, repo, fetch_started, full_refresh_at, open_by_number, closed_by_number)
 
-# Filter out pull requests
-closed_issues = [i for i in closed_issues if isinstance(i, dict) and 'pull_request' not in i]
+    # Newest first, as the API lists them
+    open_issues = [open_by_number[n] for n in sorted(open_by_number, reverse=True)]
+    closed_issues = [closed_by_number[n] for n in sorted(closed_by_number, reverse=True)]
+else:
+    # No cache: fold issues into the statistics as gh streams them, never holding the full lists
+    open_issues = stream_issues(open_command, "Fetching open issues...")
+    closed_issues = stream_issues(closed_command, f"Fetching issues closed since {week_ago}...")
 
 # Calculate statistics
 stats = {
     "repository": repo,
-    "timestamp": datetime.now(timezone.utc).isoformat(),
+    "timestamp": now.isoformat(),
     "open_issues": {
-        "total": len(open_issues),
+        "total": 0,
         "by_priority": {
             "critical": 0,
             "high": 0,
@@ -101,7 +347,7 @@ stats = {
         "with_enhancement_label": 0
     },
     "closed_last_7_days": {
-        "total": len(closed_issues),
+        "total": 0,
         "average_time_to_close_hours": 0
     },
     "issues": {
@@ -111,85 +357,21 @@ stats = {
 }
 
 # Process open issues
-now = datetime.now(timezone.utc)
 for issue in open_issues:
-    created = datetime.fromisoformat(issue['created_at'].replace('Z', '+00:00'))
-    age_days = (now - created).days
-
-    # Extract priority
-    priority = "unprioritized"
-    for label in issue.get('labels', []):
-        label_name = label['name'].lower()
-        if 'critical' in label_name:
-            priority = "critical"
-            break
-        elif 'high' in label_name:
-            priority = "high"
-        elif 'medium' in label_name and priority == "unprioritized":
-            priority = "medium"
-        elif 'low' in label_name and priority == "unprioritized":
-            priority = "low"
-
-    stats["open_issues"]["by_priority"][priority] += 1
-
-    # Categorize by age
-    if age_days < 1:
-        stats["open_issues"]["by_age"]["new"] += 1
-    elif age_days <= 7:
-        stats["open_issues"]["by_age"]["recent"] += 1
-    elif age_days <= 30:
-        stats["open_issues"]["by_age"]["active"] += 1
-    elif age_days <= 90:
-        stats["open_issues"]["by_age"]["stale"] += 1
-    else:
-        stats["open_issues"]["by_age"]["ancient"] += 1
-
-    # Count by area and type
-    for label in issue.get('labels', []):
-        label_name = label['name'].lower()
-        if label_name.startswith('area:'):
-            area = label_name.replace('area:', '').strip()
-            stats["open_issues"]["by_area"][area] = stats["open_issues"]["by_area"].get(area, 0) + 1
-        if label_name == 'bug':
-            stats["open_issues"]["with_bug_label"] += 1
-        if label_name == 'enhancement':
-            stats["open_issues"]["with_enhancement_label"] += 1
-
-    # Add to issues list
-    stats["issues"]["open"].append({
-        "number": issue['number'],
-        "title": issue['title'],
-        "url": issue['html_url'],
-        "created_at": issue['created_at'],
-        "age_days": age_days,
-        "priority": priority,
-        "labels": [l['name'] for l in issue.get('labels', [])]
-    })
+    add_open_issue(stats, issue, now)
 
 # Process closed issues
 total_close_time = 0
 closed_with_time = 0
 for issue in closed_issues:
-    if issue.get('closed_at'):
-        created = datetime.fromisoformat(issue['created_at'].replace('Z', '+00:00'))
-        closed = datetime.fromisoformat(issue['closed_at'].replace('Z', '+00:00'))
-        time_to_close = (closed - created).total_seconds() / 3600  # in hours
+    time_to_close = add_closed_issue(stats, issue)
+    if time_to_close is not None:
         total_close_time += time_to_close
         closed_with_time += 1
 
-        stats["issues"]["recently_closed"].append({
-            "number": issue['number'],
-            "title": issue['title'],
-            "url": issue['html_url'],
-            "closed_at": issue['closed_at'],
-            "time_to_close_hours": round(time_to_close, 1)
-        })
-
 if closed_with_time > 0:
     stats["closed_last_7_days"]["average_time_to_close_hours"] = round(total_close_time / closed_with_time, 1)
 
-# Output directory from environment or default
-output_dir = os.environ.get('OUTPUT_DIR', '/tmp/issue-data')
 os.makedirs(output_dir, exist_ok=True)
 
 # Save statistics